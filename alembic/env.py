@@ -1,22 +1,79 @@
 """Alembic migration environment."""
 
-from safir.database import run_migrations_offline, run_migrations_online
+import asyncio
+
+from safir.database import create_database_engine, run_migrations_offline
 from safir.logging import configure_alembic_logging, configure_logging
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
 
 from alembic import context
 from wobbly.config import config
+from wobbly.migrations import IN_PROCESS_ATTRIBUTE
 from wobbly.schema import SchemaBase
 
-# Configure structlog.
-configure_logging(name="wobbly", log_level=config.log_level)
-configure_alembic_logging()
+LOCK_TIMEOUT = "5s"
+"""Maximum time a migration will wait to acquire a lock before failing."""
+
+MIGRATION_LOCK_ID = 0x776F62626C79
+"""Key of the PostgreSQL advisory lock held while running migrations."""
+
+
+def do_migrations(connection: Connection) -> None:
+    """Run the migrations on the provided connection.
+
+    Each migration is run in its own transaction so that migrations may use
+    an autocommit block for operations such as ``CREATE INDEX CONCURRENTLY``
+    that cannot run inside a transaction. The lock timeout is set for the
+    session and committed before Alembic sees the connection so that Alembic
+    doesn't treat the connection as being in an external transaction.
+
+    Every Wobbly replica may run migrations on startup, so a session-level
+    advisory lock serializes them. A replica that has to wait for the lock
+    will then find the schema already current and do nothing. The lock is
+    acquired before setting the lock timeout, since the wait for another
+    replica's migrations may be arbitrarily long.
+    """
+    lock_id = {"id": MIGRATION_LOCK_ID}
+    connection.execute(text("SELECT pg_advisory_lock(:id)"), lock_id)
+    try:
+        connection.execute(text(f"SET lock_timeout = '{LOCK_TIMEOUT}'"))
+        connection.commit()
+        context.configure(
+            connection=connection,
+            target_metadata=SchemaBase.metadata,
+            transaction_per_migration=True,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    finally:
+        connection.rollback()
+        connection.execute(text("SELECT pg_advisory_unlock(:id)"), lock_id)
+        connection.commit()
+
+
+async def run_migrations_online() -> None:
+    """Run the migrations against the configured database."""
+    engine = create_database_engine(
+        config.database_url, config.database_password
+    )
+    try:
+        async with engine.connect() as connection:
+            await connection.run_sync(do_migrations)
+    finally:
+        await engine.dispose()
+
+
+# Configure structlog, unless the migrations are being run from within Wobbly,
+# which has already configured logging.
+if not context.config.attributes.get(IN_PROCESS_ATTRIBUTE):
+    configure_logging(
+        profile=config.profile, log_level=config.log_level, name="wobbly"
+    )
+    configure_alembic_logging()
 
 # Run the migrations.
 if context.is_offline_mode():
     run_migrations_offline(SchemaBase.metadata, config.database_url)
 else:
-    run_migrations_online(
-        SchemaBase.metadata,
-        config.database_url,
-        config.database_password,
-    )
+    asyncio.run(run_migrations_online())
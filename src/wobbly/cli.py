@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-import subprocess
 from pathlib import Path
 
 import click
@@ -11,14 +9,16 @@ import structlog
 from safir.asyncio import run_with_asyncio
 from safir.click import display_help
 from safir.database import (
-    create_database_engine,
     initialize_database,
     is_database_current,
-    stamp_database,
+    stamp_database_async,
 )
+from safir.logging import configure_alembic_logging, configure_logging
 
 from .config import config
+from .database import create_database_engine
 from .factory import Factory
+from .migrations import upgrade_schema
 from .schema import SchemaBase
 
 __all__ = [
@@ -34,6 +34,9 @@ __all__ = [
 @click.version_option(message="%(version)s")
 def main() -> None:
     """Administrative command-line interface for wobbly."""
+    configure_logging(
+        profile=config.profile, log_level=config.log_level, name="wobbly"
+    )
 
 
 @main.command()
@@ -52,23 +55,28 @@ def help(ctx: click.Context, topic: str | None) -> None:
     default=Path("/app/alembic.ini"),
     help="Alembic configuration file.",
 )
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help="Number of jobs to delete in each transaction.",
+)
 @run_with_asyncio
-async def expire(*, alembic_config_path: Path) -> None:
+async def expire(*, alembic_config_path: Path, batch_size: int) -> None:
     """Delete expired jobs.
 
     Delete jobs that have passed their destruction time. The job records are
     deleted in their entirety.
     """
     logger = structlog.get_logger("wobbly")
-    engine = create_database_engine(
-        config.database_url, config.database_password
-    )
+    engine = create_database_engine(config)
     try:
         if not await is_database_current(engine, logger, alembic_config_path):
             raise click.ClickException("Database schema is not current")
         async with Factory.standalone(engine, logger) as factory:
             job_service = factory.create_job_service()
-            await job_service.delete_expired()
+            await job_service.delete_expired(batch_size)
     finally:
         await engine.dispose()
 
@@ -84,22 +92,19 @@ async def expire(*, alembic_config_path: Path) -> None:
 @click.option(
     "--reset", is_flag=True, help="Delete all existing database data."
 )
-def init(*, alembic_config_path: Path, reset: bool) -> None:
+@run_with_asyncio
+async def init(*, alembic_config_path: Path, reset: bool) -> None:
     """Initialize the database storage."""
-    engine = create_database_engine(
-        config.database_url, config.database_password
-    )
+    engine = create_database_engine(config)
     logger = structlog.get_logger("wobbly")
-
-    async def _init_db() -> None:
+    try:
         await initialize_database(
             engine, logger, schema=SchemaBase.metadata, reset=reset
         )
+        await stamp_database_async(engine, alembic_config_path)
+    finally:
         await engine.dispose()
 
-    asyncio.run(_init_db())
-    stamp_database(alembic_config_path)
-
 
 @main.command()
 @click.option(
@@ -111,11 +116,8 @@ def init(*, alembic_config_path: Path, reset: bool) -> None:
 )
 def update_schema(*, alembic_config_path: Path) -> None:
     """Update the schema."""
-    subprocess.run(
-        ["alembic", "upgrade", "head"],
-        check=True,
-        cwd=str(alembic_config_path.parent),
-    )
+    configure_alembic_logging()
+    upgrade_schema(alembic_config_path)
 
 
 @main.command()
@@ -129,9 +131,7 @@ def update_schema(*, alembic_config_path: Path) -> None:
 @run_with_asyncio
 async def validate_schema(*, alembic_config_path: Path) -> None:
     """Validate that the database schema is current."""
-    engine = create_database_engine(
-        config.database_url, config.database_password
-    )
+    engine = create_database_engine(config)
     logger = structlog.get_logger("wobbly")
     if not await is_database_current(engine, logger, alembic_config_path):
         raise click.ClickException("Database schema is not current")
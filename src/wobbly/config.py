@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Literal
+
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from safir.logging import LogLevel, Profile, configure_logging
+from safir.logging import LogLevel, Profile
 from safir.metrics import MetricsConfiguration, metrics_configuration_factory
 from safir.pydantic import EnvAsyncPostgresDsn
 
@@ -15,7 +18,16 @@ class Config(BaseSettings):
     """Configuration for wobbly."""
 
     model_config = SettingsConfigDict(
-        env_prefix="WOBBLY_", case_sensitive=False
+        env_prefix="WOBBLY_", case_sensitive=False, frozen=True
+    )
+
+    alembic_config_path: Path = Field(
+        Path("alembic.ini"),
+        title="Alembic configuration file",
+        description=(
+            "Used to check whether the database schema is current and to run"
+            " schema migrations during startup"
+        ),
     )
 
     database_url: EnvAsyncPostgresDsn = Field(
@@ -28,15 +40,106 @@ class Config(BaseSettings):
         None, title="Password for UWS job database"
     )
 
+    database_max_overflow: int = Field(
+        10,
+        title="Database connection pool overflow",
+        description=(
+            "Number of database connections that may be opened beyond the"
+            " pool size when all pooled connections are in use. The sum of"
+            " the pool size and overflow across all Wobbly processes must be"
+            " less than the PostgreSQL ``max_connections`` setting"
+        ),
+        ge=0,
+    )
+
+    database_pool_pre_ping: bool = Field(
+        False,
+        title="Check database connections before use",
+        description=(
+            "Whether to test each database connection when it is checked out"
+            " of the pool and replace it if it has been closed. This costs a"
+            " round trip to the database for every checkout, so only enable"
+            " it if connections are being closed by something between"
+            " Wobbly and the database"
+        ),
+    )
+
+    database_pool_recycle: int | None = Field(
+        None,
+        title="Database connection lifetime",
+        description=(
+            "If set, database connections older than this many seconds are"
+            " replaced the next time they are checked out of the pool"
+        ),
+        ge=1,
+    )
+
+    database_pool_size: int = Field(
+        5,
+        title="Database connection pool size",
+        description=(
+            "Number of database connections kept open in the connection pool."
+            " This limits how many requests can use the database concurrently"
+            " without opening additional overflow connections"
+        ),
+        ge=1,
+    )
+
+    database_pool_timeout: float = Field(
+        30,
+        title="Database connection pool timeout",
+        description=(
+            "How long in seconds to wait for a database connection from the"
+            " pool before failing the request"
+        ),
+        gt=0,
+    )
+
+    database_pool_warm_size: int = Field(
+        5,
+        title="Database connections to open at startup",
+        description=(
+            "Number of database connections to open when the application"
+            " starts so that early requests do not have to wait for new"
+            " connections. Should not exceed the size of the connection pool."
+        ),
+        ge=0,
+    )
+
     log_level: LogLevel = Field(
         LogLevel.INFO, title="Log level of the application's logger"
     )
 
+    max_service_requests: int | None = Field(
+        None,
+        title="Concurrent requests per service",
+        description=(
+            "If set, the maximum number of requests from a single service"
+            " that will be handled at the same time. Additional requests"
+            " wait for earlier ones to finish. Each request uses at most one"
+            " database connection, so setting this below the database pool"
+            " size prevents one service from using all of the database"
+            " connections"
+        ),
+        ge=1,
+    )
+
     metrics: MetricsConfiguration = Field(
         default_factory=metrics_configuration_factory,
         title="Metrics configuration",
     )
 
+    migration_mode: Literal["sync", "async", "skip"] = Field(
+        "skip",
+        title="Schema migration mode",
+        description=(
+            "How to handle schema migrations during startup. ``skip`` requires"
+            " the schema to already be current, ``sync`` runs migrations"
+            " before accepting requests, and ``async`` runs migrations in a"
+            " background task while requests are being served"
+        ),
+    )
+
     name: str = Field("wobbly", title="Name of application")
 
     path_prefix: str = Field("/wobbly", title="URL prefix for application")
@@ -54,9 +157,3 @@ class Config(BaseSettings):
 
 config = Config()
 """Configuration for wobbly."""
-
-
-# Ensure this is always run so that command-line tools can rely on it as well.
-configure_logging(
-    profile=config.profile, log_level=config.log_level, name="wobbly"
-)
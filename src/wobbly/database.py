@@ -0,0 +1,82 @@
+"""Database engine utilities for Wobbly."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from .config import Config
+
+__all__ = ["create_database_engine", "warm_connection_pool"]
+
+
+def create_database_engine(
+    config: Config, *, isolation_level: str | None = None
+) -> AsyncEngine:
+    """Create a new async database engine.
+
+    This is equivalent to the Safir function of the same name, but also
+    configures the engine's connection pool from the Wobbly configuration.
+    Connections are reused in LIFO order so that a small set of recently-used
+    connections stays busy while the rest sit idle and can be recycled.
+
+    Parameters
+    ----------
+    config
+        Wobbly configuration.
+    isolation_level
+        If specified, sets a non-default isolation level for the database
+        engine.
+
+    Returns
+    -------
+    sqlalchemy.ext.asyncio.AsyncEngine
+        Newly-created database engine. When done with the engine, the caller
+        must call ``await engine.dispose()``.
+    """
+    url = make_url(str(config.database_url))
+    url = url.set(drivername="postgresql+asyncpg")
+    if config.database_password:
+        password = config.database_password.get_secret_value()
+        url = url.set(password=password)
+    kwargs: dict[str, Any] = {}
+    if isolation_level:
+        kwargs["isolation_level"] = isolation_level
+    if config.database_pool_recycle:
+        kwargs["pool_recycle"] = config.database_pool_recycle
+    return create_async_engine(
+        url,
+        max_overflow=config.database_max_overflow,
+        pool_size=config.database_pool_size,
+        pool_pre_ping=config.database_pool_pre_ping,
+        pool_timeout=config.database_pool_timeout,
+        pool_use_lifo=True,
+        **kwargs,
+    )
+
+
+async def warm_connection_pool(engine: AsyncEngine, count: int) -> None:
+    """Open database connections so that they are ready for use.
+
+    Opens the given number of connections concurrently, checks that each of
+    them works, and returns them to the engine's connection pool. This avoids
+    having the first requests after startup wait for new connections to be
+    established. The count should not exceed the size of the connection pool,
+    since any additional connections will be closed when they are returned.
+
+    Parameters
+    ----------
+    engine
+        Database engine whose connection pool should be filled.
+    count
+        Number of connections to open.
+    """
+
+    async def ping() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(count)))
@@ -10,7 +10,6 @@ from dataclasses import dataclass
 from typing import Annotated, Any
 
 from fastapi import Depends, Request
-from safir.dependencies.db_session import db_session_dependency
 from safir.dependencies.logger import logger_dependency
 from safir.metrics import EventManager
 from sqlalchemy.ext.asyncio import async_scoped_session
@@ -18,6 +17,7 @@ from structlog.stdlib import BoundLogger
 
 from ..events import Events
 from ..factory import Factory
+from .db_session import db_session_dependency
 
 __all__ = [
     "ContextDependency",
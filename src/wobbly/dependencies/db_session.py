@@ -0,0 +1,64 @@
+"""Manage an async database session."""
+
+from collections.abc import AsyncIterator
+
+from safir.database import create_async_session
+from sqlalchemy.ext.asyncio import AsyncEngine, async_scoped_session
+
+__all__ = ["DatabaseSessionDependency", "db_session_dependency"]
+
+
+class DatabaseSessionDependency:
+    """Manages an async per-request SQLAlchemy session.
+
+    This is equivalent to the Safir dependency of the same name except that
+    it uses a database engine provided by the caller rather than creating its
+    own. This allows Wobbly to configure the engine's connection pool and to
+    use the same engine during application startup.
+    """
+
+    def __init__(self) -> None:
+        self._engine: AsyncEngine | None = None
+        self._session: async_scoped_session | None = None
+
+    async def __call__(self) -> AsyncIterator[async_scoped_session]:
+        """Return the database session manager.
+
+        Returns
+        -------
+        sqlalchemy.ext.asyncio.async_scoped_session
+            The database session proxy.
+        """
+        if not self._session:
+            raise RuntimeError("db_session_dependency not initialized")
+        try:
+            yield self._session
+        finally:
+            # Each session is scoped to a single web request, but all of them
+            # share the same underlying engine and connection pool.
+            await self._session.remove()
+
+    async def aclose(self) -> None:
+        """Shut down the database engine."""
+        if self._engine:
+            await self._engine.dispose()
+            self._engine = None
+            self._session = None
+
+    async def initialize(self, engine: AsyncEngine) -> None:
+        """Initialize the session dependency.
+
+        Parameters
+        ----------
+        engine
+            Database engine to use. The dependency takes ownership of the
+            engine and will dispose of it in `aclose`.
+        """
+        if self._engine:
+            await self._engine.dispose()
+        self._engine = engine
+        self._session = await create_async_session(engine)
+
+
+db_session_dependency = DatabaseSessionDependency()
+"""The dependency that will return the async session proxy."""
@@ -0,0 +1,63 @@
+"""Limit concurrent requests from a single service."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+__all__ = ["ServiceLimiter", "service_limiter"]
+
+
+class ServiceLimiter:
+    """Limit the number of concurrent requests from each service.
+
+    All services share the same database connection pool, so a burst of
+    requests from one service could otherwise use every connection and delay
+    requests from all other services. Each service gets its own semaphore,
+    and requests beyond the limit wait for an earlier request from the same
+    service to finish.
+
+    This limits requests, not database connections. Each request holds at
+    most one database session, so the number of connections used by a
+    service is bounded by its request limit.
+    """
+
+    def __init__(self) -> None:
+        self._limit: int | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def initialize(self, limit: int | None) -> None:
+        """Set the per-service limit.
+
+        Parameters
+        ----------
+        limit
+            Maximum number of concurrent requests from a single service, or
+            `None` to not limit requests.
+        """
+        self._limit = limit
+        self._semaphores = {}
+
+    @asynccontextmanager
+    async def limit(self, service: str) -> AsyncIterator[None]:
+        """Hold one of the request slots for a service.
+
+        Parameters
+        ----------
+        service
+            Name of the service making the request.
+        """
+        if not self._limit:
+            yield
+            return
+        semaphore = self._semaphores.get(service)
+        if not semaphore:
+            semaphore = asyncio.Semaphore(self._limit)
+            self._semaphores[service] = semaphore
+        async with semaphore:
+            yield
+
+
+service_limiter = ServiceLimiter()
+"""Process-wide limiter for concurrent requests from each service."""
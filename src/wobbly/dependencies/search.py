@@ -45,7 +45,7 @@ async def job_search_dependency(
 ) -> JobSearch:
     """Collect common search parameters for a job."""
     return JobSearch(
-        phases=set(phase) if phase else None,
+        phases=frozenset(phase) if phase else None,
         since=since,
         cursor=JobCursor.from_str(cursor) if cursor else None,
         limit=limit,
@@ -33,6 +33,8 @@ class Factory:
         Logger to use.
     """
 
+    __slots__ = ("_events", "_logger", "_session")
+
     @classmethod
     @asynccontextmanager
     async def standalone(
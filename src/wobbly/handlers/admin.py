@@ -7,7 +7,7 @@ by an admin-only ``GafaelfawrIngress``.
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Body, Depends
 from safir.models import ErrorLocation
 from safir.slack.webhook import SlackRouteErrorHandler
 from safir.uws import SerializedJob
@@ -16,6 +16,7 @@ from ..dependencies.context import RequestContext, context_dependency
 from ..dependencies.search import job_search_dependency
 from ..exceptions import UnknownJobError
 from ..models import JobIdentifier, JobSearch
+from ..responses import JobListResponse, JobResponse
 
 __all__ = ["router"]
 
@@ -26,7 +27,7 @@ router = APIRouter(route_class=SlackRouteErrorHandler)
 @router.get(
     "/admin/jobs",
     description="List jobs for any user or service",
-    response_model_exclude_defaults=True,
+    response_model=list[SerializedJob],
     summary="List jobs",
     tags=["admin"],
 )
@@ -34,13 +35,36 @@ async def list_jobs(
     *,
     search: Annotated[JobSearch, Depends(job_search_dependency)],
     context: Annotated[RequestContext, Depends(context_dependency)],
-    response: Response,
-) -> list[SerializedJob]:
+) -> JobListResponse:
     job_service = context.factory.create_job_service()
     results = await job_service.list_jobs(search)
+    headers = {}
     if search.cursor or search.limit:
-        response.headers["Link"] = results.link_header(context.request.url)
-    return results.entries
+        headers["Link"] = results.link_header(context.request.url)
+    return JobListResponse(results.entries, headers=headers)
+
+
+@router.post(
+    "/admin/jobs/bulk-get",
+    description=(
+        "Retrieve the records for several jobs in a single request. Jobs"
+        " that do not exist are omitted from the results."
+    ),
+    response_model=list[SerializedJob],
+    summary="Get several jobs",
+    tags=["admin"],
+)
+async def bulk_get_jobs(
+    job_ids: Annotated[
+        list[JobIdentifier],
+        Body(title="Jobs to retrieve", min_length=1, max_length=500),
+    ],
+    *,
+    context: Annotated[RequestContext, Depends(context_dependency)],
+) -> JobListResponse:
+    job_service = context.factory.create_job_service()
+    jobs = await job_service.get_many(job_ids)
+    return JobListResponse(jobs)
 
 
 @router.get(
@@ -75,7 +99,7 @@ async def list_service_users(
 @router.get(
     "/admin/services/{service}/users/{user}/jobs",
     description="List jobs for a user and service",
-    response_model_exclude_defaults=True,
+    response_model=list[SerializedJob],
     summary="List jobs",
     tags=["admin"],
 )
@@ -85,19 +109,19 @@ async def list_service_user_jobs(
     *,
     search: Annotated[JobSearch, Depends(job_search_dependency)],
     context: Annotated[RequestContext, Depends(context_dependency)],
-    response: Response,
-) -> list[SerializedJob]:
+) -> JobListResponse:
     job_service = context.factory.create_job_service()
     results = await job_service.list_jobs(search, service, user)
+    headers = {}
     if search.cursor or search.limit:
-        response.headers["Link"] = results.link_header(context.request.url)
-    return results.entries
+        headers["Link"] = results.link_header(context.request.url)
+    return JobListResponse(results.entries, headers=headers)
 
 
 @router.get(
     "/admin/services/{service}/users/{user}/jobs/{job_id}",
     description="Retrieve the record for a single job",
-    response_model_exclude_defaults=True,
+    response_model=SerializedJob,
     summary="Get job",
 )
 async def get_job(
@@ -106,15 +130,16 @@ async def get_job(
     job_id: str,
     *,
     context: Annotated[RequestContext, Depends(context_dependency)],
-) -> SerializedJob:
+) -> JobResponse:
     job_service = context.factory.create_job_service()
     identifier = JobIdentifier(service=service, owner=user, id=job_id)
     try:
-        return await job_service.get(identifier)
+        job = await job_service.get(identifier)
     except UnknownJobError as e:
         e.location = ErrorLocation.path
         e.field_path = ["job_id"]
         raise
+    return JobResponse(job)
 
 
 @router.get(
@@ -133,7 +158,7 @@ async def list_users(
 @router.get(
     "/admin/users/{user}/jobs",
     description="List jobs for a user",
-    response_model_exclude_defaults=True,
+    response_model=list[SerializedJob],
     summary="List jobs",
     tags=["admin"],
 )
@@ -142,10 +167,10 @@ async def list_user_jobs(
     *,
     search: Annotated[JobSearch, Depends(job_search_dependency)],
     context: Annotated[RequestContext, Depends(context_dependency)],
-    response: Response,
-) -> list[SerializedJob]:
+) -> JobListResponse:
     job_service = context.factory.create_job_service()
     results = await job_service.list_jobs(search, user=user)
+    headers = {}
     if search.cursor or search.limit:
-        response.headers["Link"] = results.link_header(context.request.url)
-    return results.entries
+        headers["Link"] = results.link_header(context.request.url)
+    return JobListResponse(results.entries, headers=headers)
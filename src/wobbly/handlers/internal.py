@@ -6,15 +6,17 @@ internal status, or other information that should not be visible outside the
 Kubernetes cluster.
 """
 
+from functools import cache
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response, status
 from safir.metadata import Metadata, get_metadata
 from safir.slack.webhook import SlackRouteErrorHandler
 
 from ..config import config
 from ..dependencies.context import RequestContext, context_dependency
-from ..models import HealthCheck
+from ..migrations import migration_runner
+from ..models import HealthCheck, HealthStatus, MigrationCheck, MigrationStatus
 
 __all__ = ["router"]
 
@@ -34,21 +36,64 @@ router = APIRouter(route_class=SlackRouteErrorHandler)
     summary="Application metadata",
 )
 async def get_index() -> Metadata:
+    return _get_index_metadata()
+
+
+@cache
+def _get_index_metadata() -> Metadata:
+    """Get the application metadata.
+
+    The metadata does not change while the application is running, so it is
+    only read from the package metadata once.
+    """
     return get_metadata(package_name="wobbly", application_name=config.name)
 
 
 @router.get(
     "/health",
     description=(
-        "Perform service health check. This route is not exposed outside the"
-        " cluster and therefore cannot be used by external clients."
+        "Report that the application is running without checking the"
+        " database. Intended for use as a liveness check. This route is not"
+        " exposed outside the cluster and therefore cannot be used by"
+        " external clients."
+    ),
+    include_in_schema=False,
+    summary="Liveness check",
+)
+async def get_health() -> HealthCheck:
+    return HealthCheck(status=HealthStatus.HEALTHY)
+
+
+@router.get(
+    "/health/db",
+    description=(
+        "Perform service health check, including a database query. This"
+        " route is not exposed outside the cluster and therefore cannot be"
+        " used by external clients."
     ),
     include_in_schema=False,
     summary="Health check",
 )
-async def get_health(
+async def get_health_db(
     *,
     context: Annotated[RequestContext, Depends(context_dependency)],
 ) -> HealthCheck:
     job_service = context.factory.create_job_service()
     return await job_service.health()
+
+
+@router.get(
+    "/health/migration",
+    description=(
+        "Report the status of schema migrations run during startup. Returns"
+        " a 503 status code until the migrations are complete. This route is"
+        " not exposed outside the cluster and therefore cannot be used by"
+        " external clients."
+    ),
+    include_in_schema=False,
+    summary="Migration status",
+)
+async def get_health_migration(response: Response) -> MigrationCheck:
+    if migration_runner.status != MigrationStatus.COMPLETE:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return MigrationCheck(status=migration_runner.status)
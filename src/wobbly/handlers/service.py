@@ -7,18 +7,21 @@ by Gafaelfawr and used to limit the view of the UWS database accessible to the
 service.
 """
 
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Header, Path, Response
+from fastapi import APIRouter, Body, Depends, Header, Path
 from safir.dependencies.gafaelfawr import auth_dependency
 from safir.models import ErrorLocation
 from safir.slack.webhook import SlackRouteErrorHandler
 from safir.uws import JobCreate, SerializedJob
 
 from ..dependencies.context import RequestContext, context_dependency
+from ..dependencies.limit import service_limiter
 from ..dependencies.search import job_search_dependency
 from ..exceptions import UnknownJobError
 from ..models import JobIdentifier, JobSearch, JobUpdate
+from ..responses import JobListResponse, JobResponse
 
 __all__ = ["router"]
 
@@ -28,15 +31,19 @@ router = APIRouter(route_class=SlackRouteErrorHandler)
 
 async def auth_service_dependency(
     x_auth_request_service: Annotated[str, Header(include_in_schema=False)],
-) -> str:
+) -> AsyncIterator[str]:
     """Get the authenticated service from the Gaelfawr headers.
 
-    Returns
-    -------
+    The request holds one of that service's request slots until it is
+    complete, limiting how many requests from one service run at once.
+
+    Yields
+    ------
     str
         Identifier of the service making the request.
     """
-    return x_auth_request_service
+    async with service_limiter.limit(x_auth_request_service):
+        yield x_auth_request_service
 
 
 async def job_identifier_dependency(
@@ -51,7 +58,7 @@ async def job_identifier_dependency(
 @router.get(
     "/jobs",
     description="List the jobs for the authenticated user",
-    response_model_exclude_defaults=True,
+    response_model=list[SerializedJob],
     summary="List jobs",
 )
 async def list_jobs(
@@ -60,19 +67,19 @@ async def list_jobs(
     user: Annotated[str, Depends(auth_dependency)],
     search: Annotated[JobSearch, Depends(job_search_dependency)],
     context: Annotated[RequestContext, Depends(context_dependency)],
-    response: Response,
-) -> list[SerializedJob]:
+) -> JobListResponse:
     job_service = context.factory.create_job_service()
     results = await job_service.list_jobs(search, service, user)
+    headers = {}
     if search.cursor or search.limit:
-        response.headers["Link"] = results.link_header(context.request.url)
-    return results.entries
+        headers["Link"] = results.link_header(context.request.url)
+    return JobListResponse(results.entries, headers=headers)
 
 
 @router.post(
     "/jobs",
     description="Create a new job for the authenticated user",
-    response_model_exclude_defaults=True,
+    response_model=SerializedJob,
     status_code=201,
     summary="Create job",
 )
@@ -82,33 +89,32 @@ async def create_job(
     user: Annotated[str, Depends(auth_dependency)],
     job_data: JobCreate,
     context: Annotated[RequestContext, Depends(context_dependency)],
-    response: Response,
-) -> SerializedJob:
+) -> JobResponse:
     job_service = context.factory.create_job_service()
     job = await job_service.create(service, user, job_data)
     url = context.request.url_for("get_job", job_id=job.id)
-    response.headers["Location"] = str(url)
-    return job
+    return JobResponse(job, status_code=201, headers={"Location": str(url)})
 
 
 @router.get(
     "/jobs/{job_id}",
     description="Retrieve the record for a single job",
-    response_model_exclude_defaults=True,
+    response_model=SerializedJob,
     summary="Get job",
 )
 async def get_job(
     *,
     job_id: Annotated[JobIdentifier, Depends(job_identifier_dependency)],
     context: Annotated[RequestContext, Depends(context_dependency)],
-) -> SerializedJob:
+) -> JobResponse:
     job_service = context.factory.create_job_service()
     try:
-        return await job_service.get(job_id)
+        job = await job_service.get(job_id)
     except UnknownJobError as e:
         e.location = ErrorLocation.path
         e.field_path = ["job_id"]
         raise
+    return JobResponse(job)
 
 
 @router.delete(
@@ -134,7 +140,7 @@ async def delete_job(
 @router.patch(
     "/jobs/{job_id}",
     description="Update the record for a single job",
-    response_model_exclude_defaults=True,
+    response_model=SerializedJob,
     summary="Update job",
 )
 async def patch_job(
@@ -142,11 +148,12 @@ async def patch_job(
     job_id: Annotated[JobIdentifier, Depends(job_identifier_dependency)],
     update: Annotated[JobUpdate, Body()],
     context: Annotated[RequestContext, Depends(context_dependency)],
-) -> SerializedJob:
+) -> JobResponse:
     job_service = context.factory.create_job_service()
     try:
-        return await job_service.update(job_id, update)
+        job = await job_service.update(job_id, update)
     except UnknownJobError as e:
         e.location = ErrorLocation.path
         e.field_path = ["job_id"]
         raise
+    return JobResponse(job)
@@ -15,16 +15,19 @@ from importlib.metadata import metadata, version
 
 import structlog
 from fastapi import FastAPI
-from safir.database import create_database_engine, is_database_current
-from safir.dependencies.db_session import db_session_dependency
+from safir.database import is_database_current
 from safir.fastapi import ClientRequestError, client_request_error_handler
-from safir.logging import configure_uvicorn_logging
+from safir.logging import configure_logging, configure_uvicorn_logging
 from safir.middleware.x_forwarded import XForwardedMiddleware
 from safir.slack.webhook import SlackRouteErrorHandler
 
 from .config import config
+from .database import create_database_engine, warm_connection_pool
 from .dependencies.context import context_dependency
+from .dependencies.db_session import db_session_dependency
+from .dependencies.limit import service_limiter
 from .handlers import admin, internal, service
+from .migrations import migration_runner
 
 __all__ = ["app"]
 
@@ -33,27 +36,37 @@ __all__ = ["app"]
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Set up and tear down the application."""
     logger = structlog.get_logger("wobbly")
-    engine = create_database_engine(
-        config.database_url, config.database_password
-    )
-    if not await is_database_current(engine, logger):
-        raise RuntimeError("Database schema out of date")
-    await engine.dispose()
-    await db_session_dependency.initialize(
-        config.database_url,
-        config.database_password,
-        isolation_level="REPEATABLE READ",
-    )
+    engine = create_database_engine(config, isolation_level="REPEATABLE READ")
+    try:
+        match config.migration_mode:
+            case "sync":
+                await migration_runner.run(config.alembic_config_path)
+            case "async":
+                migration_runner.start(config.alembic_config_path, logger)
+            case "skip":
+                config_path = config.alembic_config_path
+                if not await is_database_current(engine, logger, config_path):
+                    raise RuntimeError("Database schema out of date")
+        await warm_connection_pool(engine, config.database_pool_warm_size)
+    except Exception:
+        await engine.dispose()
+        raise
+    await db_session_dependency.initialize(engine)
     event_manager = config.metrics.make_manager()
     await event_manager.initialize()
     await context_dependency.initialize(event_manager)
+    service_limiter.initialize(config.max_service_requests)
 
     yield
 
+    await migration_runner.aclose()
     await db_session_dependency.aclose()
     await event_manager.aclose()
 
 
+configure_logging(
+    profile=config.profile, log_level=config.log_level, name="wobbly"
+)
 configure_uvicorn_logging(config.log_level)
 
 app = FastAPI(
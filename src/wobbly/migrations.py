@@ -0,0 +1,126 @@
+"""Schema migrations run from within Wobbly."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from structlog.stdlib import BoundLogger
+
+from alembic import command
+from alembic.config import Config as AlembicConfig
+
+from .models import MigrationStatus
+
+__all__ = [
+    "IN_PROCESS_ATTRIBUTE",
+    "MigrationRunner",
+    "migration_runner",
+    "upgrade_schema",
+]
+
+IN_PROCESS_ATTRIBUTE = "wobbly_in_process"
+"""Alembic config attribute set when migrations are run from within Wobbly.
+
+The Alembic environment checks for this attribute and, if it is set, leaves
+the logging configuration of the running process alone.
+"""
+
+
+def upgrade_schema(config_path: Path) -> None:
+    """Upgrade the database schema to the current version.
+
+    Alembic is run in-process rather than in a subprocess. This must not be
+    called from a thread with a running event loop, since the Alembic
+    environment uses `asyncio.run` to apply the migrations. The caller is
+    responsible for configuring logging.
+
+    Parameters
+    ----------
+    config_path
+        Path to the Alembic configuration.
+    """
+    alembic_config = AlembicConfig(str(config_path))
+    alembic_config.attributes[IN_PROCESS_ATTRIBUTE] = True
+    command.upgrade(alembic_config, "head")
+
+
+class MigrationRunner:
+    """Run schema migrations during startup and track their status.
+
+    Attributes
+    ----------
+    status
+        Status of the most recent migration run. This starts as complete,
+        since if no migrations were requested, the application will have
+        verified that the schema is current before starting.
+    """
+
+    def __init__(self) -> None:
+        self.status = MigrationStatus.COMPLETE
+        self._task: asyncio.Task[None] | None = None
+
+    async def aclose(self) -> None:
+        """Wait for any background migrations to finish.
+
+        The migrations run in a separate thread and therefore cannot be
+        cancelled, so this waits for them to complete.
+        """
+        if self._task:
+            await self._task
+            self._task = None
+
+    async def run(self, config_path: Path) -> None:
+        """Run schema migrations and wait for them to complete.
+
+        The migrations are run in a separate thread so that they do not block
+        the event loop.
+
+        Parameters
+        ----------
+        config_path
+            Path to the Alembic configuration.
+
+        Raises
+        ------
+        Exception
+            Raised if the migrations failed.
+        """
+        self.status = MigrationStatus.RUNNING
+        try:
+            await asyncio.to_thread(upgrade_schema, config_path)
+        except Exception:
+            self.status = MigrationStatus.FAILED
+            raise
+        self.status = MigrationStatus.COMPLETE
+
+    def start(self, config_path: Path, logger: BoundLogger) -> None:
+        """Start schema migrations in a background task.
+
+        Parameters
+        ----------
+        config_path
+            Path to the Alembic configuration.
+        logger
+            Logger used to report the outcome of the migrations.
+        """
+        self.status = MigrationStatus.PENDING
+        self._task = asyncio.create_task(
+            self._run_background(config_path, logger)
+        )
+
+    async def _run_background(
+        self, config_path: Path, logger: BoundLogger
+    ) -> None:
+        """Run schema migrations, reporting any failure to the logger."""
+        logger.info("Starting schema migrations")
+        try:
+            await self.run(config_path)
+        except Exception:
+            logger.exception("Schema migrations failed")
+        else:
+            logger.info("Finished schema migrations")
+
+
+migration_runner = MigrationRunner()
+"""Process-wide runner for schema migrations."""
@@ -5,9 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Annotated, Self, override
+from typing import Annotated, Any, Self, override
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Discriminator, Field, Tag
 from safir.database import DatetimeIdCursor
 from safir.metadata import Metadata as SafirMetadata
 from safir.uws import (
@@ -32,6 +32,8 @@ __all__ = [
     "JobIdentifier",
     "JobSearch",
     "JobUpdate",
+    "MigrationCheck",
+    "MigrationStatus",
 ]
 
 
@@ -57,7 +59,22 @@ class Index(BaseModel):
     metadata: SafirMetadata = Field(..., title="Package metadata")
 
 
-@dataclass
+class MigrationStatus(Enum):
+    """Status of schema migrations run by the application on startup."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETE = "complete"
+    FAILED = "failed"
+
+
+class MigrationCheck(BaseModel):
+    """Results of a check of the status of schema migrations."""
+
+    status: Annotated[MigrationStatus, Field(title="Migration status")]
+
+
+@dataclass(frozen=True, slots=True)
 class JobIdentifier:
     """Information required to identify a unique job.
 
@@ -100,11 +117,11 @@ class JobCursor(DatetimeIdCursor[SerializedJob]):
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobSearch:
     """Collects common search parameters for jobs."""
 
-    phases: set[ExecutionPhase] | None = None
+    phases: frozenset[ExecutionPhase] | None = None
     """Include only jobs in the given phases."""
 
     since: datetime | None = None
@@ -117,12 +134,29 @@ class JobSearch:
     """Limit the number of jobs returned to at most this count."""
 
 
-type JobUpdate = Annotated[
-    JobUpdateAborted
-    | JobUpdateCompleted
-    | JobUpdateError
-    | JobUpdateExecuting
-    | JobUpdateQueued
-    | JobUpdateMetadata,
+def _job_update_tag(value: Any) -> str:
+    """Determine the type of a job update from its phase.
+
+    Job metadata updates have no phase, so use a separate tag for them.
+    """
+    if isinstance(value, dict):
+        phase = value.get("phase")
+    else:
+        phase = getattr(value, "phase", None)
+    if phase is None:
+        return "metadata"
+    return phase.value if isinstance(phase, ExecutionPhase) else str(phase)
+
+
+# mypy does not accept nested Annotated types in a type statement, so this
+# has to be a plain assignment.
+JobUpdate = Annotated[
+    Annotated[JobUpdateAborted, Tag(ExecutionPhase.ABORTED.value)]
+    | Annotated[JobUpdateCompleted, Tag(ExecutionPhase.COMPLETED.value)]
+    | Annotated[JobUpdateError, Tag(ExecutionPhase.ERROR.value)]
+    | Annotated[JobUpdateExecuting, Tag(ExecutionPhase.EXECUTING.value)]
+    | Annotated[JobUpdateQueued, Tag(ExecutionPhase.QUEUED.value)]
+    | Annotated[JobUpdateMetadata, Tag("metadata")],
+    Discriminator(_job_update_tag),
     Field(title="Update to job"),
 ]
@@ -0,0 +1,38 @@
+"""Response classes for Wobbly routes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from safir.uws import SerializedJob
+
+__all__ = ["JobListResponse", "JobResponse"]
+
+_job_adapter = TypeAdapter(SerializedJob)
+_job_list_adapter = TypeAdapter(list[SerializedJob])
+
+
+class JobResponse(JSONResponse):
+    """JSON response containing a single job.
+
+    The job is serialized directly to JSON by Pydantic, omitting fields with
+    default values. Returning this response from a route bypasses FastAPI's
+    response validation and its conversion of the model to a dictionary
+    before encoding it as JSON, so the route decorator should specify the
+    ``response_model`` for documentation purposes.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _job_adapter.dump_json(content, exclude_defaults=True)
+
+
+class JobListResponse(JSONResponse):
+    """JSON response containing a list of jobs.
+
+    Serialized the same way as `JobResponse`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _job_list_adapter.dump_json(content, exclude_defaults=True)
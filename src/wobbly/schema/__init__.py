@@ -5,6 +5,7 @@ from __future__ import annotations
 from .base import SchemaBase
 from .error import JobError
 from .job import Job
+from .operations import create_index_concurrently, drop_index_concurrently
 from .result import JobResult
 
 __all__ = [
@@ -12,4 +13,6 @@ __all__ = [
     "JobError",
     "JobResult",
     "SchemaBase",
+    "create_index_concurrently",
+    "drop_index_concurrently",
 ]
@@ -0,0 +1,82 @@
+"""Alembic operations for online changes to the UWS database schema."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy import text
+
+from alembic import op
+
+__all__ = ["create_index_concurrently", "drop_index_concurrently"]
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    *,
+    unique: bool = False,
+) -> None:
+    """Create an index without blocking writes to its table.
+
+    May only be called from an Alembic migration. PostgreSQL does not allow
+    ``CREATE INDEX CONCURRENTLY`` inside a transaction, so the current
+    migration transaction is committed and the index is created in an
+    autocommit block.
+
+    If a previous attempt to create the index concurrently failed, PostgreSQL
+    leaves behind an invalid index with the same name. That index is dropped
+    and recreated, since otherwise it would be silently kept and never used.
+    An existing valid index is left alone.
+
+    Parameters
+    ----------
+    index_name
+        Name of the index.
+    table_name
+        Name of the table to index.
+    columns
+        Columns to include in the index.
+    unique
+        Whether to create a unique index.
+    """
+    with op.get_context().autocommit_block():
+        stmt = text(
+            "SELECT NOT indisvalid FROM pg_index"
+            " WHERE indexrelid = to_regclass(:name)"
+        )
+        if op.get_bind().execute(stmt, {"name": index_name}).scalar():
+            op.drop_index(
+                index_name, table_name=table_name, postgresql_concurrently=True
+            )
+        op.create_index(
+            index_name,
+            table_name,
+            list(columns),
+            unique=unique,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Drop an index without blocking writes to its table.
+
+    May only be called from an Alembic migration. The index is dropped in an
+    autocommit block for the same reason as `create_index_concurrently`.
+
+    Parameters
+    ----------
+    index_name
+        Name of the index.
+    table_name
+        Name of the table the index is on.
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import assert_never
+from typing import Any, assert_never
 
 from safir.database import PaginatedList
 from safir.datetime import format_datetime_for_logging
@@ -82,7 +82,9 @@ class JobService:
             Full job record of the newly-created job.
         """
         job = await self._storage.add(service, owner, job_data)
-        event = CreatedJobEvent(service=service, username=owner)
+        event = CreatedJobEvent.model_construct(
+            service=service, username=owner
+        )
         await self._events.created.publish(event)
         self._logger.info(
             "Created job", service=service, owner=owner, job=job.id
@@ -112,22 +114,41 @@ class JobService:
             job=job_id.id,
         )
 
-    async def delete_expired(self) -> None:
+    async def delete_expired(self, batch_size: int = 1000) -> int:
         """Delete all jobs that have passed their destruction time.
 
         The jobs are deleted out of the database entirely, not moved to
-        ``ARCHIVED`` status.
+        ``ARCHIVED`` status. They are deleted in batches, each in its own
+        transaction, so that memory usage and transaction size stay bounded
+        no matter how many jobs have expired.
 
         Be aware that Wobbly has no access to the job queue and therefore
         cannot cancel deleted jobs, so if the destruction time is very short,
         the job may still be executing, and the attempt to update the record
         when it completes will fail with an HTTP 404 error.
+
+        Parameters
+        ----------
+        batch_size
+            Maximum number of jobs to delete in each transaction.
+
+        Returns
+        -------
+        int
+            Total count of jobs deleted.
         """
-        jobs = await self._storage.list_expired()
-        if jobs:
-            self._logger.info(f"Deleting {len(jobs)} expired jobs")
-        count = await self._storage.delete_list(j.id for j in jobs)
-        self._logger.info(f"Finished deleting {count} expired jobs")
+        total = 0
+        while True:
+            count = await self._storage.delete_expired(batch_size)
+            total += count
+            if count:
+                self._logger.info(
+                    f"Deleted batch of {count} expired jobs", total=total
+                )
+            if count < batch_size:
+                break
+        self._logger.info(f"Finished deleting {total} expired jobs")
+        return total
 
     async def get(self, job_id: JobIdentifier) -> SerializedJob:
         """Retrieve a job by ID.
@@ -149,6 +170,24 @@ class JobService:
         """
         return await self._storage.get(job_id)
 
+    async def get_many(
+        self, job_ids: list[JobIdentifier]
+    ) -> list[SerializedJob]:
+        """Retrieve several jobs by ID.
+
+        Parameters
+        ----------
+        job_ids
+            Identifiers of the jobs to retrieve.
+
+        Returns
+        -------
+        list of SerializedJob
+            Jobs that were found, in the order of the identifiers. Unknown
+            jobs are omitted rather than raising an exception.
+        """
+        return await self._storage.get_many(job_ids)
+
     async def health(self) -> HealthCheck:
         """Check health of service.
 
@@ -241,17 +280,14 @@ class JobService:
         UnknownJobError
             Raised if the job was not found.
         """
-        logger = self._logger.bind(
-            service=job_id.service, owner=job_id.owner, job=job_id.id
-        )
+        log_data: dict[str, Any] = {}
         match update:
             case JobUpdateAborted():
                 job = await self._storage.mark_aborted(job_id)
-                aborted_event = AbortedJobEvent(
+                aborted_event = AbortedJobEvent.model_construct(
                     service=job.service, username=job.owner
                 )
                 await self._events.aborted.publish(aborted_event)
-                logger = logger.bind(phase=job.phase.value)
             case JobUpdateCompleted():
                 job = await self._storage.mark_completed(
                     job_id, update.results
@@ -259,59 +295,56 @@ class JobService:
                 if not (job.start_time and job.end_time):
                     msg = "Completed job has no start or end time"
                     raise RuntimeError(msg)
-                completed_event = CompletedJobEvent(
+                completed_event = CompletedJobEvent.model_construct(
                     service=job.service,
                     username=job.owner,
                     elapsed=job.end_time - job.start_time,
                 )
                 await self._events.completed.publish(completed_event)
-                logger = logger.bind(phase=job.phase.value)
             case JobUpdateError():
                 job = await self._storage.mark_failed(job_id, update.errors)
                 if not (job.start_time and job.end_time):
                     msg = "Failed job has no start or end time"
                     raise RuntimeError(msg)
-                failed_event = FailedJobEvent(
+                failed_event = FailedJobEvent.model_construct(
                     service=job.service,
                     username=job.owner,
                     error_code=update.errors[0].code,
                     elapsed=job.end_time - job.start_time,
                 )
                 await self._events.failed.publish(failed_event)
-                logger = logger.bind(
-                    phase=job.phase.value,
-                    errors=[
-                        {"code": e.code, "message": e.message}
-                        for e in update.errors
-                    ],
-                )
+                log_data["errors"] = [
+                    {"code": e.code, "message": e.message}
+                    for e in update.errors
+                ]
             case JobUpdateExecuting():
                 job = await self._storage.mark_executing(
                     job_id, update.start_time
                 )
-                logger = logger.bind(
-                    phase=job.phase.value,
-                    start_time=format_datetime_for_logging(update.start_time),
-                )
+                start_time = format_datetime_for_logging(update.start_time)
+                log_data["start_time"] = start_time
             case JobUpdateQueued():
                 job = await self._storage.mark_queued(
                     job_id, update.message_id
                 )
-                queued_event = QueuedJobEvent(
+                queued_event = QueuedJobEvent.model_construct(
                     service=job.service, username=job.owner
                 )
                 await self._events.queued.publish(queued_event)
-                logger = logger.bind(
-                    phase=job.phase.value, message_id=update.message_id
-                )
+                log_data["message_id"] = update.message_id
             case JobUpdateMetadata():
                 job = await self._storage.update(job_id, update)
                 time = format_datetime_for_logging(update.destruction_time)
-                logger = logger.bind(
-                    destruction_time=time,
-                    execution_duration=update.execution_duration,
-                )
+                log_data["destruction_time"] = time
+                log_data["execution_duration"] = update.execution_duration
             case _ as unreachable:
                 assert_never(unreachable)
-        logger.info("Updated job")
+        self._logger.info(
+            "Updated job",
+            service=job_id.service,
+            owner=job_id.owner,
+            job=job_id.id,
+            phase=job.phase.value,
+            **log_data,
+        )
         return job
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from datetime import UTC, datetime
+from datetime import datetime, timedelta
 
 from safir.database import (
     PaginatedList,
     PaginatedQueryRunner,
+    datetime_from_db,
     datetime_to_db,
     retry_async_transaction,
 )
@@ -19,8 +19,9 @@ from safir.uws import (
     JobUpdateMetadata,
     SerializedJob,
 )
-from sqlalchemy import delete, select
+from sqlalchemy import ColumnElement, Select, delete, lambda_stmt, select
 from sqlalchemy.ext.asyncio import async_scoped_session
+from sqlalchemy.orm import InstrumentedAttribute
 from vo_models.uws.types import ExecutionPhase
 
 from .exceptions import UnknownJobError
@@ -31,6 +32,31 @@ from .schema import JobResult as SQLJobResult
 
 __all__ = ["JobStore"]
 
+_MAX_JOB_ID = 2**31 - 1
+"""Largest job ID that fits in the database column."""
+
+
+def _parse_job_id(job_id: str) -> int | None:
+    """Convert a job ID to the numeric ID used in the database.
+
+    Parameters
+    ----------
+    job_id
+        Job ID as provided by the client.
+
+    Returns
+    -------
+    int or None
+        Numeric job ID, or `None` if the ID is not an ASCII decimal number in
+        the range of job IDs and therefore cannot match any job.
+    """
+    if not job_id.isascii() or not job_id.isdigit():
+        return None
+    if len(job_id.lstrip("0")) > len(str(_MAX_JOB_ID)):
+        return None
+    numeric_id = int(job_id)
+    return numeric_id if numeric_id <= _MAX_JOB_ID else None
+
 
 class JobStore:
     """Stores and manipulates jobs in the database.
@@ -89,7 +115,7 @@ class JobStore:
         async with self._session.begin():
             self._session.add(job)
             await self._session.flush()
-            return SerializedJob.model_validate(job, from_attributes=True)
+            return self._to_model(job)
 
     async def delete(self, job_id: JobIdentifier) -> bool:
         """Delete a job by ID.
@@ -114,22 +140,34 @@ class JobStore:
             result = await self._session.execute(stmt)
             return result.rowcount >= 1
 
-    async def delete_list(self, job_ids: Iterable[str]) -> int:
-        """Delete a list of jobs.
+    async def delete_expired(self, limit: int) -> int:
+        """Delete a batch of jobs that have passed their destruction time.
+
+        Excludes jobs that are already marked as archived. Each call deletes
+        at most ``limit`` jobs in a single transaction so that deleting a
+        large number of expired jobs doesn't require a long-running
+        transaction.
 
         Parameters
         ----------
-        job_ids
-            Identifiers of jobs to delete. This is only the unique key, not
-            the service and owner. The caller is responsible for any needed
-            verification of job ownership.
+        limit
+            Maximum number of jobs to delete.
 
         Returns
         -------
         int
-            Count of rows affected.
+            Count of jobs deleted.
         """
-        stmt = delete(SQLJob).where(SQLJob.id.in_(int(i) for i in job_ids))
+        now = datetime_to_db(current_datetime())
+        expired = (
+            select(SQLJob.id)
+            .where(
+                SQLJob.destruction_time <= now,
+                SQLJob.phase != ExecutionPhase.ARCHIVED,
+            )
+            .limit(limit)
+        )
+        stmt = delete(SQLJob).where(SQLJob.id.in_(expired.scalar_subquery()))
         async with self._session.begin():
             result = await self._session.execute(stmt)
             return result.rowcount
@@ -154,29 +192,41 @@ class JobStore:
         """
         async with self._session.begin():
             job = await self._get_job(job_id)
-            return SerializedJob.model_validate(job, from_attributes=True)
+            return self._to_model(job)
 
-    async def list_expired(self) -> list[SerializedJob]:
-        """List jobs that have passed their destruction time.
+    async def get_many(
+        self, job_ids: list[JobIdentifier]
+    ) -> list[SerializedJob]:
+        """Retrieve several jobs by ID with a single query.
 
-        Excludes jobs that are already marked as archived.
+        Parameters
+        ----------
+        job_ids
+            Identifiers of the jobs to retrieve.
 
         Returns
         -------
         list of SerializedJob
-            List of expired jobs that are not currently archived.
+            Jobs that were found, in the order of the identifiers. Jobs that
+            do not exist or do not match the service or owner of their
+            identifier are omitted.
         """
-        now = datetime_to_db(datetime.now(tz=UTC))
-        stmt = select(SQLJob).where(
-            SQLJob.destruction_time <= now,
-            SQLJob.phase != ExecutionPhase.ARCHIVED,
-        )
+        numeric_ids = [_parse_job_id(i.id) for i in job_ids]
+        ids = {i for i in numeric_ids if i is not None}
+        if not ids:
+            return []
+        stmt = select(SQLJob).where(SQLJob.id.in_(ids))
         async with self._session.begin():
-            jobs = await self._session.scalars(stmt)
-            return [
-                SerializedJob.model_validate(j, from_attributes=True)
-                for j in jobs
-            ]
+            found = {j.id: j for j in await self._session.scalars(stmt)}
+            jobs = []
+            for job_id, numeric_id in zip(job_ids, numeric_ids, strict=True):
+                job = found.get(numeric_id) if numeric_id is not None else None
+                if not job or job.service != job_id.service:
+                    continue
+                if job_id.owner and job.owner != job_id.owner:
+                    continue
+                jobs.append(self._to_model(job))
+            return jobs
 
     async def list_jobs(
         self,
@@ -226,9 +276,9 @@ class JobStore:
         list of str
             List of service names.
         """
-        stmt = select(SQLJob.service).order_by(SQLJob.service)
+        stmt = self._select_distinct(SQLJob.service)
         async with self._session.begin():
-            return list(await self._session.scalars(stmt.distinct()))
+            return list(await self._session.scalars(stmt))
 
     async def list_users(self, service: str | None) -> list[str]:
         """List the users who have jobs for a given service.
@@ -243,11 +293,16 @@ class JobStore:
         list of str
             List of user names.
         """
-        stmt = select(SQLJob.owner).order_by(SQLJob.owner)
         if service:
-            stmt = stmt.where(SQLJob.service == service)
+            stmt = self._select_distinct(
+                SQLJob.owner, SQLJob.service == service
+            )
+        else:
+            # There is no index on owner alone, so a loose index scan would
+            # require a full scan per user. Use a plain DISTINCT instead.
+            stmt = select(SQLJob.owner).distinct().order_by(SQLJob.owner)
         async with self._session.begin():
-            return list(await self._session.scalars(stmt.distinct()))
+            return list(await self._session.scalars(stmt))
 
     @retry_async_transaction
     async def mark_aborted(self, job_id: JobIdentifier) -> SerializedJob:
@@ -276,7 +331,7 @@ class JobStore:
             job.phase = ExecutionPhase.ABORTED
             if job.start_time:
                 job.end_time = datetime_to_db(current_datetime())
-            return SerializedJob.model_validate(job, from_attributes=True)
+            return self._to_model(job)
 
     @retry_async_transaction
     async def mark_archived(self, job_id: JobIdentifier) -> SerializedJob:
@@ -300,7 +355,7 @@ class JobStore:
         async with self._session.begin():
             job = await self._get_job(job_id)
             job.phase = ExecutionPhase.ARCHIVED
-            return SerializedJob.model_validate(job, from_attributes=True)
+            return self._to_model(job)
 
     @retry_async_transaction
     async def mark_completed(
@@ -339,18 +394,17 @@ class JobStore:
                 job.start_time = job.end_time
             if job.phase != ExecutionPhase.ABORTED:
                 job.phase = ExecutionPhase.COMPLETED
-            for sequence, result in enumerate(results, start=1):
-                sql_result = SQLJobResult(
-                    job_id=job.id,
+            job.results.extend(
+                SQLJobResult(
                     id=result.id,
                     sequence=sequence,
                     url=result.url,
                     size=result.size,
                     mime_type=result.mime_type,
                 )
-                self._session.add(sql_result)
-            await self._session.refresh(job, ["results"])
-            return SerializedJob.model_validate(job, from_attributes=True)
+                for sequence, result in enumerate(results, start=1)
+            )
+            return self._to_model(job)
 
     @retry_async_transaction
     async def mark_failed(
@@ -389,17 +443,16 @@ class JobStore:
                 job.start_time = job.end_time
             if job.phase != ExecutionPhase.ABORTED:
                 job.phase = ExecutionPhase.ERROR
-            for error in errors:
-                sql_error = SQLJobError(
-                    job_id=job.id,
+            job.errors.extend(
+                SQLJobError(
                     type=error.type,
                     code=error.code,
                     message=error.message,
                     detail=error.detail,
                 )
-                self._session.add(sql_error)
-            await self._session.refresh(job, ["errors"])
-            return SerializedJob.model_validate(job, from_attributes=True)
+                for error in errors
+            )
+            return self._to_model(job)
 
     @retry_async_transaction
     async def mark_executing(
@@ -431,7 +484,7 @@ class JobStore:
             if job.phase in (ExecutionPhase.PENDING, ExecutionPhase.QUEUED):
                 job.phase = ExecutionPhase.EXECUTING
             job.start_time = datetime_to_db(start_time)
-            return SerializedJob.model_validate(job, from_attributes=True)
+            return self._to_model(job)
 
     @retry_async_transaction
     async def mark_queued(
@@ -466,7 +519,7 @@ class JobStore:
                 job.message_id = message_id
             if job.phase in (ExecutionPhase.PENDING, ExecutionPhase.HELD):
                 job.phase = ExecutionPhase.QUEUED
-            return SerializedJob.model_validate(job, from_attributes=True)
+            return self._to_model(job)
 
     @retry_async_transaction
     async def update(
@@ -499,15 +552,120 @@ class JobStore:
             if job_update.execution_duration:
                 duration = int(job_update.execution_duration.total_seconds())
                 job.execution_duration = duration
-            return SerializedJob.model_validate(job, from_attributes=True)
+            return self._to_model(job)
+
+    def _to_model(self, job: SQLJob) -> SerializedJob:
+        """Convert a job from the database to its Pydantic model.
+
+        The database contents were validated when they were stored, so build
+        the model without validating it again. This means the conversions
+        that validation would have done, such as adding a time zone to the
+        naive datetimes stored in the database, must be done here. Errors are
+        still validated, since their columns are nullable in the database
+        but required in the model, and only failed jobs have any errors.
+
+        Parameters
+        ----------
+        job
+            Job loaded from the database, including its errors and results.
+
+        Returns
+        -------
+        SerializedJob
+            Corresponding Pydantic model.
+        """
+        duration = None
+        if job.execution_duration is not None:
+            duration = timedelta(seconds=job.execution_duration)
+        errors = [
+            JobError.model_validate(e, from_attributes=True)
+            for e in job.errors
+        ]
+        results = [
+            JobResult.model_construct(
+                id=r.id, url=r.url, size=r.size, mime_type=r.mime_type
+            )
+            for r in job.results
+        ]
+        return SerializedJob.model_construct(
+            id=str(job.id),
+            service=job.service,
+            owner=job.owner,
+            phase=job.phase,
+            message_id=job.message_id,
+            run_id=job.run_id,
+            json_parameters=job.json_parameters,
+            creation_time=datetime_from_db(job.creation_time),
+            start_time=datetime_from_db(job.start_time),
+            end_time=datetime_from_db(job.end_time),
+            destruction_time=datetime_from_db(job.destruction_time),
+            execution_duration=duration,
+            quote=datetime_from_db(job.quote),
+            errors=errors,
+            results=results,
+        )
+
+    def _select_distinct(
+        self, column: InstrumentedAttribute, *filters: ColumnElement[bool]
+    ) -> Select:
+        """Build a query for the distinct values of an indexed column.
+
+        PostgreSQL cannot skip over duplicate index entries, so a plain
+        ``SELECT DISTINCT`` reads every matching index entry. Emulate a loose
+        index scan with a recursive common table expression instead, which
+        does one index lookup per distinct value. This requires an index
+        whose leading columns are the columns in the filters followed by the
+        column whose values are wanted.
+
+        Parameters
+        ----------
+        column
+            Column whose distinct values should be returned.
+        *filters
+            Additional conditions that rows must satisfy.
+
+        Returns
+        -------
+        sqlalchemy.sql.expression.Select
+            Query returning the distinct values in sorted order.
+        """
+        first = select(column.label("value")).where(*filters)
+        first = first.order_by(column).limit(1)
+        values = first.cte("distinct_value", recursive=True)
+        following = (
+            select(column)
+            .where(*filters, column > values.c.value)
+            .order_by(column)
+            .limit(1)
+            .scalar_subquery()
+        )
+        values = values.union_all(
+            select(following).where(values.c.value.is_not(None))
+        )
+        return (
+            select(values.c.value)
+            .where(values.c.value.is_not(None))
+            .order_by(values.c.value)
+        )
 
     async def _get_job(self, job_id: JobIdentifier) -> SQLJob:
-        """Retrieve a job from the database by job ID."""
-        stmt = select(SQLJob).where(
-            SQLJob.id == int(job_id.id), SQLJob.service == job_id.service
+        """Retrieve a job from the database by job ID.
+
+        Every job read and state transition goes through this query, so it is
+        built as a lambda statement. SQLAlchemy then caches the constructed
+        statement as well as its compiled SQL and only extracts the new
+        parameter values on each call.
+        """
+        numeric_id = int(job_id.id)
+        service = job_id.service
+        owner = job_id.owner
+        stmt = lambda_stmt(
+            lambda: select(SQLJob).where(
+                SQLJob.id == numeric_id, SQLJob.service == service
+            )
         )
-        if job_id.owner:
-            stmt = stmt.where(SQLJob.owner == job_id.owner)
+        if owner:
+            stmt += lambda s: s.where(SQLJob.owner == owner)
         job = (await self._session.execute(stmt)).scalar_one_or_none()
         if not job:
             raise UnknownJobError(job_id.id)
@@ -16,7 +16,9 @@ import structlog
 from click.testing import CliRunner
 from safir.database import (
     create_database_engine,
+    drop_database,
     initialize_database,
+    is_database_current,
     stamp_database_async,
 )
 from safir.datetime import current_datetime
@@ -49,17 +51,24 @@ def test_expire(event_loop: asyncio.AbstractEventLoop) -> None:
         await stamp_database_async(engine)
         async with Factory.standalone(engine, logger) as factory:
             job_service = factory.create_job_service()
-            await job_service.create("service", "owner", job_create_one)
+            for _ in range(3):
+                await job_service.create("service", "owner", job_create_one)
             await job_service.create("service", "owner", job_create_two)
             jobs = await job_service.list_jobs(JobSearch())
-            assert len(jobs.entries) == 2
+            assert len(jobs.entries) == 4
 
     event_loop.run_until_complete(setup())
     runner = CliRunner()
     alembic_config_path = str(Path(__file__).parent.parent / "alembic.ini")
     result = runner.invoke(
         main,
-        ["expire", "--alembic-config-path", alembic_config_path],
+        [
+            "expire",
+            "--alembic-config-path",
+            alembic_config_path,
+            "--batch-size",
+            "2",
+        ],
         catch_exceptions=False,
     )
     assert result.exit_code == 0
@@ -74,3 +83,25 @@ def test_expire(event_loop: asyncio.AbstractEventLoop) -> None:
         await engine.dispose()
 
     event_loop.run_until_complete(check())
+
+
+def test_update_schema(event_loop: asyncio.AbstractEventLoop) -> None:
+    engine = create_database_engine(
+        config.database_url, config.database_password
+    )
+    alembic_config_path = Path(__file__).parent.parent / "alembic.ini"
+    event_loop.run_until_complete(drop_database(engine, SchemaBase.metadata))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["update-schema", "--alembic-config-path", str(alembic_config_path)],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+
+    async def check() -> None:
+        assert await is_database_current(engine, None, alembic_config_path)
+        await engine.dispose()
+
+    event_loop.run_until_complete(check())
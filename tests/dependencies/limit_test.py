@@ -0,0 +1,69 @@
+"""Tests for limiting concurrent requests from a service."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from wobbly.dependencies.limit import ServiceLimiter
+
+
+async def hold(
+    limiter: ServiceLimiter,
+    service: str,
+    entered: asyncio.Event,
+    release: asyncio.Event,
+) -> None:
+    async with limiter.limit(service):
+        entered.set()
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_limit() -> None:
+    limiter = ServiceLimiter()
+    limiter.initialize(1)
+    release = asyncio.Event()
+    entered = [asyncio.Event() for _ in range(3)]
+    first = asyncio.create_task(hold(limiter, "one", entered[0], release))
+    await asyncio.wait_for(entered[0].wait(), 1)
+
+    # A second request from the same service has to wait, but a request
+    # from another service does not.
+    second = asyncio.create_task(hold(limiter, "one", entered[1], release))
+    other = asyncio.create_task(hold(limiter, "two", entered[2], release))
+    await asyncio.wait_for(entered[2].wait(), 1)
+    assert not entered[1].is_set()
+
+    release.set()
+    await asyncio.wait_for(asyncio.gather(first, second, other), 1)
+    assert entered[1].is_set()
+
+
+@pytest.mark.asyncio
+async def test_no_limit() -> None:
+    limiter = ServiceLimiter()
+    limiter.initialize(None)
+    release = asyncio.Event()
+    entered = [asyncio.Event() for _ in range(5)]
+    tasks = [
+        asyncio.create_task(hold(limiter, "one", e, release)) for e in entered
+    ]
+    await asyncio.wait_for(asyncio.gather(*(e.wait() for e in entered)), 1)
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_release_on_error() -> None:
+    limiter = ServiceLimiter()
+    limiter.initialize(1)
+    with pytest.raises(ValueError, match="failed"):
+        async with limiter.limit("one"):
+            raise ValueError("failed")
+
+    # The slot must have been released, so this doesn't wait.
+    release = asyncio.Event()
+    release.set()
+    await asyncio.wait_for(hold(limiter, "one", asyncio.Event(), release), 1)
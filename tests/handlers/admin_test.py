@@ -6,6 +6,7 @@ from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
+from safir.database import PaginationLinkData
 
 
 @pytest.mark.asyncio
@@ -93,3 +94,136 @@ async def test_admin(client: AsyncClient) -> None:
     r = await client.get("/wobbly/admin/jobs")
     assert r.status_code == 200
     assert r.json() == [job_two, job_one]
+
+
+@pytest.mark.asyncio
+async def test_admin_pagination(client: AsyncClient) -> None:
+    destruction = datetime.now(tz=UTC) + timedelta(days=30)
+    for n in range(5):
+        r = await client.post(
+            "/wobbly/jobs",
+            json={
+                "json_parameters": {"id": n},
+                "destruction_time": destruction.isoformat(),
+            },
+            headers={
+                "X-Auth-Request-Service": f"service-{n % 2}",
+                "X-Auth-Request-User": f"user-{n % 3}",
+            },
+        )
+        assert r.status_code == 201
+
+    # Admin listings across all services are paginated with a cursor.
+    r = await client.get("/wobbly/admin/jobs", params={"limit": 3})
+    assert r.status_code == 200
+    assert [j["json_parameters"]["id"] for j in r.json()] == [4, 3, 2]
+    link_data = PaginationLinkData.from_header(r.headers["Link"])
+    assert not link_data.prev_url
+    assert link_data.next_url
+    assert "cursor=" in link_data.next_url
+    r = await client.get(link_data.next_url)
+    assert r.status_code == 200
+    assert [j["json_parameters"]["id"] for j in r.json()] == [1, 0]
+    link_data = PaginationLinkData.from_header(r.headers["Link"])
+    assert not link_data.next_url
+    assert link_data.prev_url
+
+
+@pytest.mark.asyncio
+async def test_admin_distinct(client: AsyncClient) -> None:
+    destruction = datetime.now(tz=UTC) + timedelta(days=30)
+    jobs = [
+        ("service-b", "user-2"),
+        ("service-a", "user-3"),
+        ("service-b", "user-1"),
+        ("service-b", "user-2"),
+        ("service-c", "user-2"),
+        ("service-a", "user-1"),
+        ("service-b", "user-1"),
+        ("service-a", "user-1"),
+        ("service-b", "user-2"),
+    ]
+    for service, user in jobs:
+        r = await client.post(
+            "/wobbly/jobs",
+            json={
+                "json_parameters": {},
+                "destruction_time": destruction.isoformat(),
+            },
+            headers={
+                "X-Auth-Request-Service": service,
+                "X-Auth-Request-User": user,
+            },
+        )
+        assert r.status_code == 201
+
+    # Each service and user is listed once, in sorted order, even though most
+    # of them have several jobs.
+    r = await client.get("/wobbly/admin/services")
+    assert r.status_code == 200
+    assert r.json() == ["service-a", "service-b", "service-c"]
+    expected = {
+        "service-a": ["user-1", "user-3"],
+        "service-b": ["user-1", "user-2"],
+        "service-c": ["user-2"],
+        "service-d": [],
+    }
+    for service, users in expected.items():
+        r = await client.get(f"/wobbly/admin/services/{service}/users")
+        assert r.status_code == 200
+        assert r.json() == users
+    r = await client.get("/wobbly/admin/users")
+    assert r.status_code == 200
+    assert r.json() == ["user-1", "user-2", "user-3"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_get(client: AsyncClient) -> None:
+    destruction = datetime.now(tz=UTC) + timedelta(days=30)
+    jobs = []
+    for service, user in (("some-service", "user"), ("other", "other-user")):
+        r = await client.post(
+            "/wobbly/jobs",
+            json={
+                "json_parameters": {"foo": "bar"},
+                "destruction_time": destruction.isoformat(),
+            },
+            headers={
+                "X-Auth-Request-Service": service,
+                "X-Auth-Request-User": user,
+            },
+        )
+        assert r.status_code == 201
+        jobs.append(r.json())
+
+    # Results are returned in the order requested, and jobs that don't exist
+    # or don't match the service or owner are omitted. IDs that are not valid
+    # job IDs are treated as nonexistent jobs, and zero-padded IDs match the
+    # same job as the unpadded ID.
+    r = await client.post(
+        "/wobbly/admin/jobs/bulk-get",
+        json=[
+            {"service": "other", "id": jobs[1]["id"]},
+            {"service": "some-service", "id": jobs[0]["id"], "owner": "user"},
+            {"service": "other", "id": jobs[0]["id"]},
+            {"service": "other", "id": jobs[1]["id"], "owner": "user"},
+            {"service": "some-service", "id": "1000"},
+            {"service": "some-service", "id": "bogus"},
+            {"service": "some-service", "id": "\u00b2"},
+            {"service": "some-service", "id": "-1"},
+            {"service": "some-service", "id": str(2**31)},
+            {"service": "some-service", "id": "9" * 5000},
+            {"service": "some-service", "id": "0" + jobs[0]["id"]},
+        ],
+    )
+    assert r.status_code == 200
+    assert r.json() == [jobs[1], jobs[0], jobs[0]]
+
+    # There must be at least one and no more than 500 jobs requested.
+    r = await client.post("/wobbly/admin/jobs/bulk-get", json=[])
+    assert r.status_code == 422
+    r = await client.post(
+        "/wobbly/admin/jobs/bulk-get",
+        json=[{"service": "other", "id": str(i)} for i in range(501)],
+    )
+    assert r.status_code == 422
@@ -16,9 +16,13 @@ async def test_health(client: AsyncClient) -> None:
     r = await client.get("/health")
     assert r.status_code == 200
     assert r.json() == {"status": "healthy"}
+    r = await client.get("/health/db")
+    assert r.status_code == 200
+    assert r.json() == {"status": "healthy"}
 
     # Force a health check failure by dropping the database, which should
-    # produce database errors.
+    # produce database errors. The liveness check doesn't use the database
+    # and should still succeed.
     engine = create_database_engine(
         config.database_url, config.database_password
     )
@@ -28,8 +32,17 @@ async def test_health(client: AsyncClient) -> None:
         transport=ASGITransport(app=app, raise_app_exceptions=False),
         base_url="https://example.com/",
     ) as error_client:
-        r = await error_client.get("/health")
+        r = await error_client.get("/health/db")
         assert r.status_code == 500
+        r = await error_client.get("/health")
+        assert r.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_health_migration(client: AsyncClient) -> None:
+    r = await client.get("/health/migration")
+    assert r.status_code == 200
+    assert r.json() == {"status": "complete"}
 
 
 @pytest.mark.asyncio
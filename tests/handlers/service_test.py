@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 from unittest.mock import ANY
@@ -9,12 +10,15 @@ from unittest.mock import ANY
 import pytest
 from httpx import AsyncClient
 from safir.database import PaginationLinkData, datetime_to_db
-from safir.dependencies.db_session import db_session_dependency
 from safir.metrics import NOT_NONE, MockEventPublisher
 from sqlalchemy import select
 from vo_models.uws.types import ErrorType
 
+from wobbly import main
+from wobbly.config import Config
 from wobbly.dependencies.context import context_dependency
+from wobbly.dependencies.db_session import db_session_dependency
+from wobbly.dependencies.limit import service_limiter
 from wobbly.schema import Job as SQLJob
 
 
@@ -344,6 +348,43 @@ async def test_update(client: AsyncClient) -> None:
     assert r.status_code == 200
     assert r.json() == job
 
+    # An explicit null phase is also a metadata update.
+    destruction = datetime.now(tz=UTC) + timedelta(days=90)
+    r = await client.patch(
+        url,
+        json={
+            "phase": None,
+            "destruction_time": destruction.isoformat(),
+            "execution_duration": 600,
+        },
+        headers=headers,
+    )
+    assert r.status_code == 200
+    job["destruction_time"] = destruction.strftime("%Y-%m-%dT%H:%M:%SZ")
+    job["execution_duration"] = 600
+    assert r.json() == job
+
+    # Phases that cannot be set with an update and values that aren't phases
+    # are rejected based on the phase alone.
+    for phase in ("PENDING", 5):
+        r = await client.patch(
+            url,
+            json={
+                "phase": phase,
+                "destruction_time": destruction.isoformat(),
+                "execution_duration": 600,
+            },
+            headers=headers,
+        )
+        assert r.status_code == 422
+        error = r.json()["detail"][0]
+        assert error["type"] == "union_tag_invalid"
+        assert error["loc"] == ["body"]
+        assert error["ctx"]["tag"] == str(phase)
+    r = await client.get(url, headers=headers)
+    assert r.status_code == 200
+    assert r.json() == job
+
 
 @pytest.mark.asyncio
 async def test_errors(client: AsyncClient) -> None:
@@ -606,3 +647,48 @@ async def test_pagination_empty(client: AsyncClient) -> None:
     link_data = PaginationLinkData.from_header(r.headers["Link"])
     assert not link_data.next_url
     assert not link_data.prev_url
+
+
+@pytest.fixture
+def service_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Limit each service to one concurrent request.
+
+    The configuration is loaded when Wobbly is imported, so replace the
+    configuration used by the application lifespan with one that reflects
+    the changed environment. This must be set up before the ``client``
+    fixture starts the application.
+    """
+    monkeypatch.setenv("WOBBLY_MAX_SERVICE_REQUESTS", "1")
+    monkeypatch.setattr(main, "config", Config())
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("service_limit")
+async def test_service_limit(client: AsyncClient) -> None:
+    headers = {
+        "X-Auth-Request-Service": "some-service",
+        "X-Auth-Request-User": "user",
+    }
+    other_headers = {
+        "X-Auth-Request-Service": "other-service",
+        "X-Auth-Request-User": "user",
+    }
+
+    # While the only slot for some-service is held, its requests wait but
+    # requests from other services are handled.
+    async with service_limiter.limit("some-service"):
+        waiting = asyncio.create_task(
+            client.get("/wobbly/jobs", headers=headers)
+        )
+        r = await client.get("/wobbly/jobs", headers=other_headers)
+        assert r.status_code == 200
+        await asyncio.sleep(0.1)
+        assert not waiting.done()
+    r = await asyncio.wait_for(waiting, 5)
+    assert r.status_code == 200
+
+    # A request that fails releases its slot.
+    r = await client.get("/wobbly/jobs/1", headers=headers)
+    assert r.status_code == 404
+    r = await asyncio.wait_for(client.get("/wobbly/jobs", headers=headers), 5)
+    assert r.status_code == 200
@@ -0,0 +1,75 @@
+"""Tests for schema migrations run from within Wobbly."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import structlog
+from safir.database import (
+    create_database_engine,
+    drop_database,
+    is_database_current,
+)
+
+from alembic.util import CommandError
+from wobbly.config import config
+from wobbly.migrations import MigrationRunner
+from wobbly.models import MigrationStatus
+from wobbly.schema import SchemaBase
+
+ALEMBIC_CONFIG_PATH = Path(__file__).parent.parent / "alembic.ini"
+"""Path to the Alembic configuration for the test database."""
+
+
+def get_status(runner: MigrationRunner) -> MigrationStatus:
+    """Get the status of a migration runner.
+
+    Checking the status attribute directly would let mypy narrow its type,
+    and it would then reject later checks after the runner has changed it.
+    """
+    return runner.status
+
+
+@pytest.mark.asyncio
+async def test_run(tmp_path: Path) -> None:
+    engine = create_database_engine(
+        config.database_url, config.database_password
+    )
+    await drop_database(engine, SchemaBase.metadata)
+    runner = MigrationRunner()
+
+    await runner.run(ALEMBIC_CONFIG_PATH)
+    assert get_status(runner) == MigrationStatus.COMPLETE
+    assert await is_database_current(engine, None, ALEMBIC_CONFIG_PATH)
+
+    # Running the migrations again when the schema is current does nothing.
+    await runner.run(ALEMBIC_CONFIG_PATH)
+    assert get_status(runner) == MigrationStatus.COMPLETE
+    await engine.dispose()
+
+    with pytest.raises(CommandError):
+        await runner.run(tmp_path / "alembic.ini")
+    assert get_status(runner) == MigrationStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_start(tmp_path: Path) -> None:
+    engine = create_database_engine(
+        config.database_url, config.database_password
+    )
+    await drop_database(engine, SchemaBase.metadata)
+    logger = structlog.get_logger(__name__)
+    runner = MigrationRunner()
+
+    runner.start(ALEMBIC_CONFIG_PATH, logger)
+    assert get_status(runner) == MigrationStatus.PENDING
+    await runner.aclose()
+    assert get_status(runner) == MigrationStatus.COMPLETE
+    assert await is_database_current(engine, None, ALEMBIC_CONFIG_PATH)
+    await engine.dispose()
+
+    # Failures are reported in the status rather than raised.
+    runner.start(tmp_path / "alembic.ini", logger)
+    await runner.aclose()
+    assert get_status(runner) == MigrationStatus.FAILED
@@ -3,12 +3,29 @@
 from __future__ import annotations
 
 import subprocess
+from datetime import timedelta
 
 import pytest
-from safir.database import create_database_engine, drop_database
+import structlog
+from safir.database import (
+    create_database_engine,
+    drop_database,
+    initialize_database,
+)
+from safir.datetime import current_datetime
+from safir.uws import JobCreate
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import IntegrityError
 
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
 from wobbly.config import config
-from wobbly.schema import SchemaBase
+from wobbly.factory import Factory
+from wobbly.schema import (
+    SchemaBase,
+    create_index_concurrently,
+    drop_index_concurrently,
+)
 
 
 @pytest.mark.asyncio
@@ -26,3 +43,65 @@ async def test_schema() -> None:
     await engine.dispose()
     subprocess.run(["alembic", "upgrade", "head"], check=True)
     subprocess.run(["alembic", "check"], check=True)
+
+
+@pytest.mark.asyncio
+async def test_index_operations() -> None:
+    engine = create_database_engine(
+        config.database_url, config.database_password
+    )
+    logger = structlog.get_logger(__name__)
+    await initialize_database(
+        engine, logger, schema=SchemaBase.metadata, reset=True
+    )
+    job_create = JobCreate(
+        json_parameters={},
+        destruction_time=current_datetime() + timedelta(days=1),
+    )
+    async with Factory.standalone(engine, logger) as factory:
+        job_service = factory.create_job_service()
+        for _ in range(2):
+            await job_service.create("service", "owner", job_create)
+
+    def create_index(connection: Connection) -> None:
+        with Operations.context(MigrationContext.configure(connection)):
+            create_index_concurrently(
+                "by_test", "job", ["service", "owner"], unique=True
+            )
+
+    def drop_index(connection: Connection) -> None:
+        with Operations.context(MigrationContext.configure(connection)):
+            drop_index_concurrently("by_test", "job")
+
+    async def is_index_valid() -> bool | None:
+        stmt = text(
+            "SELECT indisvalid FROM pg_index"
+            " WHERE indexrelid = to_regclass('by_test')"
+        )
+        async with engine.connect() as connection:
+            return (await connection.execute(stmt)).scalar()
+
+    # A failed concurrent index creation leaves behind an invalid index.
+    with pytest.raises(IntegrityError):
+        async with engine.connect() as connection:
+            await connection.run_sync(create_index)
+    assert await is_index_valid() is False
+
+    # Once the problem is fixed, retrying replaces the invalid index.
+    async with engine.begin() as connection:
+        await connection.execute(
+            text("DELETE FROM job WHERE id = (SELECT min(id) FROM job)")
+        )
+    async with engine.connect() as connection:
+        await connection.run_sync(create_index)
+    assert await is_index_valid() is True
+
+    # Creating an index that already exists does nothing.
+    async with engine.connect() as connection:
+        await connection.run_sync(create_index)
+    assert await is_index_valid() is True
+
+    async with engine.connect() as connection:
+        await connection.run_sync(drop_index)
+    assert await is_index_valid() is None
+    await engine.dispose()